@@ -13,10 +13,9 @@ from qtpy.QtCore import Slot, Qt
 from qtpy.QtWidgets import (
     QDialog, QListWidgetItem, QDialogButtonBox, QColorDialog, QWidget,
 )
-from qtpy.QtGui import QIcon, QPixmap
 from pyslvs import VPoint, VLink, color_names
 from pyslvs_ui.graphics import color_qt, color_icon
-from .utility import set_custom_color, add_custom_color
+from .utility import point_icon, set_custom_color, add_custom_color
 from .edit_link_ui import Ui_Dialog
 
 
@@ -42,7 +41,7 @@ class EditLinkDialog(QDialog, Ui_Dialog):
         self.vpoints = vpoints
         self.vlinks = vlinks
         icon = self.windowIcon()
-        self.icon = QIcon(QPixmap(":/icons/bearing.png"))
+        self.icon = point_icon()
         for i, e in enumerate(color_names):
             self.color_box.insertItem(i, color_icon(e), e)
         for i in range(len(self.vpoints)):
@@ -59,8 +58,10 @@ class EditLinkDialog(QDialog, Ui_Dialog):
             self.name_box.addItem(icon, "New link")
             self.color_box.setCurrentIndex(self.color_box.findText('blue'))
         else:
-            for i, vlink in enumerate(self.vlinks):
-                self.name_box.insertItem(i, icon, vlink.name)
+            # Batched fill triggers one index change instead of one per row
+            self.name_box.addItems([vlink.name for vlink in self.vlinks])
+            for i in range(len(self.vlinks)):
+                self.name_box.setItemIcon(i, icon)
             self.name_box.setCurrentIndex(row)
         self.name_edit.textChanged.connect(self.__is_ok)
         self.__is_ok()
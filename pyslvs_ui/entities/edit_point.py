@@ -10,10 +10,9 @@ __email__ = "pyslvs@gmail.com"
 from typing import List, Union
 from qtpy.QtCore import Slot, Qt
 from qtpy.QtWidgets import QDialog, QListWidgetItem, QColorDialog, QWidget
-from qtpy.QtGui import QIcon, QPixmap
 from pyslvs import VPoint, VLink, color_names
 from pyslvs_ui.graphics import color_qt, color_icon
-from .utility import set_custom_color, add_custom_color
+from .utility import link_icon, set_custom_color, add_custom_color
 from .relocate_point import RelocateDialog
 from .edit_point_ui import Ui_Dialog
 
@@ -38,7 +37,7 @@ class EditPointDialog(QDialog, Ui_Dialog):
         self.setWindowFlags(self.windowFlags()
                             & ~Qt.WindowContextHelpButtonHint)
         icon = self.windowIcon()
-        self.icon = QIcon(QPixmap(":/icons/link.png"))
+        self.icon = link_icon()
         self.vpoints = vpoints
         self.vlinks = vlinks
         vpoints_count = len(vpoints)
@@ -51,8 +50,11 @@ class EditPointDialog(QDialog, Ui_Dialog):
             self.name_box.setEnabled(False)
             self.color_box.setCurrentIndex(self.color_box.findText('green'))
         else:
+            # Batched fill triggers one index change instead of one per row
+            self.name_box.addItems([f'Point{i}'
+                                    for i in range(vpoints_count)])
             for i in range(vpoints_count):
-                self.name_box.insertItem(i, icon, f'Point{i}')
+                self.name_box.setItemIcon(i, icon)
             self.name_box.setCurrentIndex(pos)
         self.type_box.currentIndexChanged.connect(self.__check_angle)
         self.__check_angle()
@@ -7,10 +7,30 @@ __copyright__ = "Copyright (C) 2016-2020"
 __license__ = "AGPL"
 __email__ = "pyslvs@gmail.com"
 
+from typing import Optional
 from qtpy.QtWidgets import QComboBox
-from qtpy.QtGui import QColor
+from qtpy.QtGui import QColor, QIcon, QPixmap
 from pyslvs_ui.graphics import color_icon
 
+_link_icon: Optional[QIcon] = None
+_point_icon: Optional[QIcon] = None
+
+
+def link_icon() -> QIcon:
+    """Shared icon of link items, decoded on first use."""
+    global _link_icon
+    if _link_icon is None:
+        _link_icon = QIcon(QPixmap(":/icons/link.png"))
+    return _link_icon
+
+
+def point_icon() -> QIcon:
+    """Shared icon of point items, decoded on first use."""
+    global _point_icon
+    if _point_icon is None:
+        _point_icon = QIcon(QPixmap(":/icons/bearing.png"))
+    return _point_icon
+
 
 def set_custom_color(color_box: QComboBox, color_text: str):
     color_index = color_box.findText(color_text)
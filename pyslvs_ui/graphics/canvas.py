@@ -9,13 +9,14 @@ __email__ = "pyslvs@gmail.com"
 
 from typing import (
     TypeVar, Tuple, List, Sequence, Set, Dict, Mapping, Iterator, Any,
-    Optional, ClassVar, overload
+    Optional, ClassVar, Union, overload
 )
 from abc import abstractmethod, ABC
 from dataclasses import dataclass, field
 from enum import auto, unique, IntEnum
 from math import radians, sin, cos, atan2, hypot, isnan
 from functools import reduce
+from numpy import ndarray
 from qtpy.QtCore import Slot, Qt, QPointF, QRectF, QSizeF, Signal
 from qtpy.QtWidgets import QWidget, QSizePolicy
 from qtpy.QtGui import (
@@ -29,9 +30,24 @@ from .color import color_num, color_qt, target_path_style
 
 _T = TypeVar('_T')
 _Coord = Tuple[float, float]
+# Recorded paths are 2D float arrays; previews are tuples
+_Path = Union[Sequence[_Coord], ndarray]
 LINK_COLOR = QColor(226, 219, 190)
 
 
+def _at_rest(path: _Path) -> bool:
+    """Whether a path has fewer than two distinct samples.
+
+    Recorded paths arrive as 2D float arrays, whose rows are not
+    hashable; everything else is a sequence of coordinate tuples.
+    """
+    if len(path) < 2:
+        return True
+    if isinstance(path, ndarray):
+        return not (path != path[0]).any()
+    return len(set(path)) < 2
+
+
 @overload
 def convex_hull(points: List[_Coord], *, as_qpoint: bool) -> List[QPointF]:
     ...
@@ -102,8 +118,8 @@ class _PathOption:
     + Show mode parameter.
     + The path will be the curve, otherwise using the points.
     """
-    path: Sequence[Sequence[_Coord]] = ()
-    slider_path: Mapping[int, Sequence[_Coord]] = field(default_factory=dict)
+    path: Sequence[_Path] = ()
+    slider_path: Mapping[int, _Path] = field(default_factory=dict)
     show: int = -1
     curve: bool = True
 
@@ -404,9 +420,9 @@ class BaseCanvas(QWidget, metaclass=QABCMeta):
         self.painter.setPen(pen)
         self.painter.setFont(font_copy)
 
-    def draw_curve(self, path: Sequence[_Coord]) -> None:
+    def draw_curve(self, path: _Path) -> None:
         """Draw path as curve."""
-        if len(set(path)) < 2:
+        if _at_rest(path):
             return
         painter_path = QPainterPath()
         error = False
@@ -428,9 +444,9 @@ class BaseCanvas(QWidget, metaclass=QABCMeta):
                     painter_path.lineTo(p)
         self.painter.drawPath(painter_path)
 
-    def draw_dot(self, path: Sequence[_Coord]) -> None:
+    def draw_dot(self, path: _Path) -> None:
         """Draw path as dots."""
-        if len(set(path)) < 2:
+        if _at_rest(path):
             return
         for i, (x, y) in enumerate(path):
             if isnan(x):
@@ -8,6 +8,7 @@ __license__ = "AGPL"
 __email__ = "pyslvs@gmail.com"
 
 from typing import Tuple
+from functools import lru_cache
 from qtpy.QtCore import QSize
 from qtpy.QtGui import QColor, QIcon, QPixmap
 from pyslvs import color_names, color_rgb
@@ -23,8 +24,12 @@ def color_num(color_index: int) -> QColor:
     return color_qt(color_names[color_index % len(color_names)])
 
 
+@lru_cache(maxsize=256)
 def color_icon(name: str, size: int = 20) -> QIcon:
-    """Get color block as QIcon by name."""
+    """Get color block as QIcon by name.
+
+    The icons are shared; colors repeat heavily across rows.
+    """
     color_block = QPixmap(QSize(size, size))
     color_block.fill(color_qt(name))
     return QIcon(color_block)
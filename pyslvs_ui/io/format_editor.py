@@ -251,12 +251,14 @@ class FormatEditor(QObject, metaclass=QABCMeta):
 
     def __set_group(self, text: str) -> None:
         """Set group."""
-        if self.prefer.open_project_actions_option == 1:
+        # The "no undo" option clears the stack afterwards, grouping
+        # just batches the index updates during the load
+        if self.prefer.open_project_actions_option in {0, 1}:
             self.command_stack.beginMacro(f"Add {text}")
 
     def __end_group(self) -> None:
         """End group."""
-        if self.prefer.open_project_actions_option == 1:
+        if self.prefer.open_project_actions_option in {0, 1}:
             self.command_stack.endMacro()
 
     @abstractmethod
@@ -4,47 +4,108 @@ from __future__ import annotations
 
 """HDF5 format processing function."""
 
-from typing import Mapping, Union, Any
-from zlib import compress, decompress
+from typing import Tuple, Iterator, Mapping, Union, Optional, Any
+from ast import literal_eval
+from concurrent.futures import ThreadPoolExecutor
+from threading import local
+from zlib import decompress as _zlib_decompress
+from zstandard import ZstdCompressor, ZstdDecompressor
 from h5py import File, Dataset, Group
 from numpy import ndarray, array, int8, void
 from qtpy.QtWidgets import QMessageBox
 from .format_editor import FormatEditor
 
+# Zstandard frame magic, used to tell new blobs from legacy zlib ones
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+# Compressor contexts are not shareable between threads,
+# keep one per pool worker; decompression is single threaded
+_local = local()
+_DCTX = ZstdDecompressor()
+# Streaming window for payloads too big for a one-shot call
+_CHUNK = 1 << 20
+
 
 def _compress(b: bytes) -> ndarray:
     """Compress bytes."""
-    return void(compress(b, level=9))
+    cctx: Optional[ZstdCompressor] = getattr(_local, 'cctx', None)
+    if cctx is None:
+        cctx = _local.cctx = ZstdCompressor(level=3)
+    if len(b) <= _CHUNK:
+        return void(cctx.compress(b))
+    # Feed large payloads through a fixed-size window instead of
+    # holding a second full-size buffer during compression
+    obj = cctx.compressobj()
+    src = memoryview(b)
+    out = bytearray()
+    for i in range(0, len(src), _CHUNK):
+        out += obj.compress(src[i:i + _CHUNK])
+    out += obj.flush()
+    return void(bytes(out))
 
 
 def _decompress(b: ndarray) -> bytes:
     """Decompress bytes."""
-    return decompress(b.tobytes())
-
-
-def _h5py_dump(f: File, d: Mapping[str, Any], *, prefix: str = ''):
-    """Dump function for h5py."""
+    buf = b.tobytes()
+    if buf.startswith(_ZSTD_MAGIC):
+        # Streamed frames have no stored content size,
+        # a decompression object handles both layouts
+        return _DCTX.decompressobj().decompress(buf)
+    # Legacy project saved with zlib
+    return _zlib_decompress(buf)
+
+
+def _loads(expr: str) -> Any:
+    """Parse a stored Python literal without running the interpreter."""
+    try:
+        return literal_eval(expr)
+    except (ValueError, SyntaxError) as e:
+        # The dump side only ever writes repr() of plain containers;
+        # anything else is a corrupted or crafted file
+        raise ValueError(f"invalid expression in project file: {expr:.50s}"
+                         ) from e
+
+
+def _flatten(d: Mapping[str, Any], *, prefix: str = ''
+             ) -> Iterator[Tuple[str, Any]]:
+    """Flatten nested mappings into h5py path keys."""
     for k, v in d.items():
         if prefix:
             key = prefix + '/' + k
         else:
             key = k
         if type(v) is dict:
-            _h5py_dump(f, v, prefix=key)
-        elif type(v) is bytes:
-            f[key] = _compress(v)
+            yield from _flatten(v, prefix=key)
+        else:
+            yield key, v
+
+
+def _h5py_dump(f: File, d: Mapping[str, Any]):
+    """Dump function for h5py."""
+    blobs = []
+    for key, v in _flatten(d):
+        if type(v) is bytes:
+            blobs.append((key, v))
         elif type(v) is str:
-            f[key] = _compress(b's' + v.encode('utf-8'))
+            blobs.append((key, b's' + v.encode('utf-8')))
         elif type(v) in {int, float}:
             f[key] = v
         else:
             try:
                 a = array(v, dtype=int8)
             except (ValueError, TypeError):
-                # Use eval function
-                f[key] = _compress(f"!{v!r}".encode('utf-8'))
+                # Store the repr; reloaded with literal_eval
+                blobs.append((key, f"!{v!r}".encode('utf-8')))
             else:
                 f[key] = a
+    if not blobs:
+        return
+    # Compression releases the GIL, so independent blobs can be
+    # packed in parallel; h5py writes stay on the calling thread
+    with ThreadPoolExecutor(max_workers=min(8, len(blobs))) as pool:
+        for (key, _), blob in zip(blobs, pool.map(
+            lambda kv: _compress(kv[1]), blobs
+        )):
+            f[key] = blob
 
 
 def _h5py_load(f: Group) -> Mapping[str, Any]:
@@ -60,7 +121,7 @@ def _h5py_load(f: Group) -> Mapping[str, Any]:
                 if value.startswith(b's'):
                     value = value.decode('utf-8')[1:]
                 elif value.startswith(b'!'):
-                    value = eval(value.decode('utf-8')[1:])
+                    value = _loads(value.decode('utf-8')[1:])
             data[k] = value
     return data
 
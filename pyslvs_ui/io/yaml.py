@@ -10,7 +10,12 @@ __license__ = "AGPL"
 __email__ = "pyslvs@gmail.com"
 
 from re import sub
-from yaml import safe_dump, safe_load
+from yaml import dump, load
+try:
+    # libyaml backed parser and emitter
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
 from .format_editor import FormatEditor
 
 
@@ -29,7 +34,8 @@ class YamlEditor(FormatEditor):
             flow_style = True
         else:
             raise ValueError(f"unsupported option: {self.prefer.file_type_option}")
-        yaml_script = safe_dump(data, default_flow_style=flow_style)
+        yaml_script = dump(data, Dumper=SafeDumper,
+                           default_flow_style=flow_style)
         if self.prefer.file_type_option == 1:
             yaml_script = sub(r"\s\s+", " ", yaml_script)
         with open(file_name, 'w+', encoding='utf-8') as f:
@@ -39,4 +45,4 @@ class YamlEditor(FormatEditor):
         """Load YAML file."""
         with open(file_name, 'r', encoding='utf-8') as f:
             yaml_script = f.read()
-        self.load_data(file_name, safe_load(yaml_script))
+        self.load_data(file_name, load(yaml_script, Loader=SafeLoader))
@@ -138,7 +138,7 @@ class MainWindow(IOMethodInterface):
             return
         # Add the path
         i = 0
-        while f"Algorithm_{i}" in self.inputs_widget.paths():
+        while self.inputs_widget.has_path(f"Algorithm_{i}"):
             i += 1
         self.inputs_widget.add_path(f"Algorithm_{i}", path, {})
 
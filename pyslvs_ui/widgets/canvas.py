@@ -10,6 +10,7 @@ __license__ = "AGPL"
 __email__ = "pyslvs@gmail.com"
 
 from collections import deque
+from numpy import array, ndarray
 from typing import (
     cast, TYPE_CHECKING, List, Tuple, Sequence, Union, Mapping,
 )
@@ -23,8 +24,10 @@ if TYPE_CHECKING:
     from pyslvs_ui.widgets import MainWindowBase
 
 _Coord = Tuple[float, float]
-_Paths = Sequence[Sequence[_Coord]]
-_SliderPaths = Mapping[int, Sequence[_Coord]]
+# Records hand over 2D float arrays; loaded paths are tuples
+_Path = Union[Sequence[_Coord], ndarray]
+_Paths = Sequence[_Path]
+_SliderPaths = Mapping[int, _Path]
 
 
 class MainCanvas(MainCanvasBase):
@@ -248,11 +251,13 @@ class MainCanvas(MainCanvasBase):
             if vpoint.type in {VJoint.P, VJoint.RP}:
                 self.slider_record[i].append((vpoint.c[0, 0], vpoint.c[0, 1]))
 
-    def get_record_path(self) -> Tuple[Sequence[Sequence[_Coord]],
-                                       Mapping[int, Sequence[_Coord]]]:
+    def get_record_path(self) -> Tuple[_Paths, _SliderPaths]:
         """Return paths."""
-        paths = tuple(tuple(path) for path in self.path_record)
-        paths_slider = {i: tuple(p) for i, p in self.slider_record.items()}
+        # Pack each record into a float array; the sample tuples only
+        # live for the duration of the recording
+        paths = tuple(array(path) if path else () for path in self.path_record)
+        paths_slider = {i: array(p) if p else ()
+                        for i, p in self.slider_record.items()}
         self.path_record.clear()
         self.slider_record.clear()
         return paths, paths_slider
@@ -11,13 +11,11 @@ __license__ = "AGPL"
 __email__ = "pyslvs@gmail.com"
 
 from typing import (
-    TYPE_CHECKING, TypeVar, Tuple, Dict, Mapping, Sequence, Iterator, Optional,
-    Callable,
+    TYPE_CHECKING, TypeVar, Tuple, List, Dict, Mapping, Sequence, Iterator,
+    Optional, Union, Callable,
 )
-from csv import writer
-from copy import copy
-from numpy import array, hypot, arctan2
-from qtpy.QtCore import Signal, Slot, QTimer
+from numpy import array, asarray, hypot, arctan2, ndarray, savetxt
+from qtpy.QtCore import Signal, Slot, Qt, QTimer
 from qtpy.QtWidgets import (
     QWidget, QMessageBox, QInputDialog, QListWidgetItem, QApplication,
     QCheckBox,
@@ -39,8 +37,10 @@ if TYPE_CHECKING:
 _T = TypeVar('_T')
 _Coord = Tuple[float, float]
 _Vars = Sequence[Tuple[int, int]]
-_Paths = Sequence[Sequence[_Coord]]
-_SliderPaths = Mapping[int, Sequence[_Coord]]
+# Stored recordings are 2D float arrays; file data comes in as tuples
+_Path = Union[Sequence[_Coord], ndarray]
+_Paths = Sequence[_Path]
+_SliderPaths = Mapping[int, _Path]
 _AUTO_PATH = "Auto preview"  # Unified name
 
 
@@ -51,7 +51,8 @@ def _no_auto_path(path: Mapping[str, _T]) -> Mapping[str, _T]:
 
 def _variable_int(text: str) -> int:
     """Change variable text to index."""
-    return int(text.split()[-1].replace("Point", ""))
+    # Take what follows the last 'Point'; no word list, no rescan
+    return int(text.rpartition('Point')[2])
 
 
 class InputsWidget(QWidget, Ui_Form):
@@ -106,12 +107,33 @@ class InputsWidget(QWidget, Ui_Form):
         self.record_list.blockSignals(False)
         self.__paths = {_AUTO_PATH: self.main_canvas.path_preview}
         self.__slider_paths = {_AUTO_PATH: self.main_canvas.slider_path_preview}
+        # Parsed variable items; the solve loop reads them every tick,
+        # so any model change just voids the cache instead of reparsing
+        self.__pairs_cache: Optional[List[Tuple[int, int, float]]] = None
+        self.__resolve_pending = False
+        # Breaks the spin box echo of a dial move without blockSignals;
+        # the dial echo of a typed value must still reach __update_var
+        self.__updating_var = False
+        # Mirror the recording widgets; __update_var runs on every
+        # dial tick and should not query them across the binding
+        self.__record_active = self.record_start.isChecked()
+        self.__record_interval = self.record_interval.value()
+        self.record_start.toggled.connect(self.__set_record_active)
+        self.record_interval.valueChanged.connect(self.__set_record_interval)
+        model = self.variable_list.model()
+        for signal in (model.rowsInserted, model.rowsRemoved,
+                       model.rowsMoved, model.dataChanged, model.modelReset):
+            signal.connect(self.__clear_pairs_cache)
+
+        # Refreshed by variable_reload; spares a VPoint attribute
+        # fetch on every combo box change
+        self.__slider_joint: List[bool] = []
 
         def slot(widget: QCheckBox) -> Callable[[int], None]:
             @Slot(int)
             def func(ind: int) -> None:
-                widget.setEnabled(ind >= 0
-                                  and self.vpoints[ind].type != VJoint.R)
+                mask = self.__slider_joint
+                widget.setEnabled(0 <= ind < len(mask) and mask[ind])
 
             return func
 
@@ -141,12 +163,30 @@ class InputsWidget(QWidget, Ui_Form):
         self.dial_spinbox.setMaximum(500)
 
     def paths(self) -> Mapping[str, _Paths]:
-        """Return current path data."""
-        return _no_auto_path(self.__paths)
+        """Return current path data.
+
+        Stored arrays are converted back to plain tuples here so the
+        YAML and HDF5 writers see built-in types only.
+        """
+        return {
+            name: [[(float(x), float(y)) for x, y in path] for path in paths]
+            for name, paths in _no_auto_path(self.__paths).items()
+        }
+
+    def has_path(self, name: str) -> bool:
+        """Return True if the name is used by a stored path.
+
+        Unlike paths(), this does not serialize the recordings.
+        """
+        return name in self.__paths
 
     def slider_paths(self) -> Mapping[str, _SliderPaths]:
         """Return current path data."""
-        return _no_auto_path(self.__slider_paths)
+        return {
+            name: {i: [(float(x), float(y)) for x, y in path]
+                   for i, path in paths.items()}
+            for name, paths in _no_auto_path(self.__slider_paths).items()
+        }
 
     @Slot(tuple)
     def set_selection(self, selections: Sequence[int]) -> None:
@@ -167,16 +207,21 @@ class InputsWidget(QWidget, Ui_Form):
         if item is None:
             return
         p0 = _variable_int(item.text())
-        base_point = self.vpoints[p0]
+        vpoints = self.vpoints
+        base_point = vpoints[p0]
         type_int = base_point.type
         if type_int == VJoint.R:
-            for i, vpoint in enumerate(self.vpoints):
+            # Hoisted out of the scan over every point
+            same_link = base_point.same_link
+            base_grounded = base_point.grounded()
+            add_item = self.driver_list.addItem
+            for i, vpoint in enumerate(vpoints):
                 if i == p0:
                     continue
-                if base_point.same_link(vpoint):
-                    if base_point.grounded() and vpoint.grounded():
+                if same_link(vpoint):
+                    if base_grounded and vpoint.grounded():
                         continue
-                    self.driver_list.addItem(f"[{vpoint.type_str}] Point{i}")
+                    add_item(f"[{vpoint.type_str}] Point{i}")
         elif type_int in {VJoint.P, VJoint.RP}:
             self.driver_list.addItem(f"[{base_point.type_str}] Point{p0}")
 
@@ -190,7 +235,8 @@ class InputsWidget(QWidget, Ui_Form):
     def __add_inputs_variable(
         self,
         p0: Optional[int] = None,
-        p1: Optional[int] = None
+        p1: Optional[int] = None,
+        dof: Optional[int] = None
     ) -> None:
         """Add variable with '->' sign."""
         if p0 is None:
@@ -204,7 +250,9 @@ class InputsWidget(QWidget, Ui_Form):
                 return
             p1 = _variable_int(item.text())
         # Check DOF
-        if self.dof() <= self.input_count():
+        if dof is None:
+            dof = self.dof()
+        if dof <= self.input_count():
             QMessageBox.warning(
                 self,
                 "Wrong DOF",
@@ -220,30 +268,35 @@ class InputsWidget(QWidget, Ui_Form):
             )
             return
         # Check repeated pairs
-        for p0_, p1_, a in self.input_pairs():
-            if {p0, p1} == {p0_, p1_} and self.vpoints[p0].type == VJoint.R:
-                QMessageBox.warning(
-                    self,
-                    "Wrong pair",
-                    "There already have a same pair."
-                )
-                return
+        if self.vpoints[p0].type == VJoint.R:
+            pair = {p0, p1}
+            for p0_, p1_, a in self.input_pairs():
+                if pair == {p0_, p1_}:
+                    QMessageBox.warning(
+                        self,
+                        "Wrong pair",
+                        "There already have a same pair."
+                    )
+                    return
         if p0 == p1:
             # One joint by offset
             value = self.vpoints[p0].true_offset()
         else:
             # Two joints by angle
             value = self.vpoints[p0].slope_angle(self.vpoints[p1])
-        self.command_stack.push(AddInput('->'.join((
-            f'Point{p0}',
-            f"Point{p1}",
-            f"{value:.02f}",
-        )), self.variable_list))
+        value = float(f"{value:.02f}")
+        self.command_stack.push(AddInput(
+            f"Point{p0}->Point{p1}->{value:.02f}",
+            (p0, p1, value),
+            self.variable_list
+        ))
 
     def add_inputs_variables(self, variables: _Vars) -> None:
         """Add from database."""
+        # The mechanism DOF does not change while variables are added
+        dof = self.dof()
         for p0, p1 in variables:
-            self.__add_inputs_variable(p0, p1)
+            self.__add_inputs_variable(p0, p1, dof)
 
     @Slot(QListWidgetItem, name='on_variable_list_itemClicked')
     def __dial_ok(self, _=None) -> None:
@@ -266,8 +319,9 @@ class InputsWidget(QWidget, Ui_Form):
         if item is None:
             return
         expr = item.text().split('->')
-        p0 = int(expr[0].replace('Point', ''))
-        p1 = int(expr[1].replace('Point', ''))
+        # The tokens are always 'Point{i}'; skip the prefix directly
+        p0 = int(expr[0][5:])
+        p1 = int(expr[1][5:])
         value = float(expr[2])
         if p0 == p1:
             self.__set_unit_mode()
@@ -304,45 +358,90 @@ class InputsWidget(QWidget, Ui_Form):
         """Use to show input variable count."""
         return self.variable_list.count()
 
+    def __clear_pairs_cache(self, *_) -> None:
+        """The variable items changed somehow; drop the parsed pairs."""
+        self.__pairs_cache = None
+
     def input_pairs(self) -> Iterator[Tuple[int, int, float]]:
         """Back as point number code."""
-        for row in range(self.variable_list.count()):
-            var = self.variable_list.item(row).text().split('->')
-            p0 = int(var[0].replace('Point', ''))
-            p1 = int(var[1].replace('Point', ''))
-            angle = float(var[2])
-            yield p0, p1, angle
+        if self.__pairs_cache is None:
+            pairs = []
+            for row in range(self.variable_list.count()):
+                item = self.variable_list.item(row)
+                pair = item.data(Qt.UserRole)
+                if pair is None:
+                    var = item.text().split('->')
+                    pair = (int(var[0][5:]), int(var[1][5:]), float(var[2]))
+                pairs.append(pair)
+            self.__pairs_cache = pairs
+        yield from self.__pairs_cache
 
     def variable_reload(self) -> None:
         """Auto check the points and type."""
+        self.__slider_joint = [vp.type != VJoint.R for vp in self.vpoints]
         self.joint_list.clear()
         self.plot_joint.clear()
         self.wrt_joint.clear()
+        item = self.entities_point.item
+        widgets = (self.joint_list, self.plot_joint, self.wrt_joint)
         for i in range(self.entities_point.rowCount()):
-            type_text = self.entities_point.item(i, 2).text()
-            for w in [self.joint_list, self.plot_joint, self.wrt_joint]:
-                w.addItem(f"[{type_text}] Point{i}")
+            name = f"[{item(i, 2).text()}] Point{i}"
+            for w in widgets:
+                w.addItem(name)
         self.variable_value_reset()
 
+    @Slot(bool)
+    def __set_record_active(self, enabled: bool) -> None:
+        self.__record_active = enabled
+
+    @Slot(float)
+    def __set_record_interval(self, interval: float) -> None:
+        self.__record_interval = interval
+
     @Slot(float)
     def __set_var(self, value: float) -> None:
+        if self.__updating_var:
+            # Echo of __update_var writing the spin box
+            return
         self.dial.set_value(value)
 
     @Slot(float)
     def __update_var(self, value: float) -> None:
         """Update the value when rotating QDial."""
         item = self.variable_list.currentItem()
-        self.dial_spinbox.blockSignals(True)
-        self.dial_spinbox.setValue(value)
-        self.dial_spinbox.blockSignals(False)
+        self.__updating_var = True
+        try:
+            self.dial_spinbox.setValue(value)
+        finally:
+            self.__updating_var = False
         if item:
             item_text = item.text().split('->')
-            item_text[-1] = f"{value:.02f}"
-            item.setText('->'.join(item_text))
-            self.about_to_resolve.emit()
+            text = f"{value:.02f}"
+            # Sub-resolution dial ticks round to the same string;
+            # rewriting it would repaint and solve for nothing
+            if item_text[-1] != text:
+                item_text[-1] = text
+                item.setText('->'.join(item_text))
+                pair = item.data(Qt.UserRole)
+                if pair is not None:
+                    item.setData(Qt.UserRole,
+                                 (pair[0], pair[1], float(text)))
+                # Collapse a burst of value changes into one solve
+                if not self.__resolve_pending:
+                    self.__resolve_pending = True
+                    QTimer.singleShot(0, self.__flush_resolve)
+
+    @Slot()
+    def __flush_resolve(self) -> None:
+        """Emit one resolve for all value changes of this event turn."""
+        self.__resolve_pending = False
+        self.about_to_resolve.emit()
+        # Sample only after the solve, so the record holds the joint
+        # positions that belong to the current value
+        value = self.dial.value()
         if (
-            self.record_start.isChecked()
-            and abs(self.oldVar - value) > self.record_interval.value()
+            self.__record_active
+            and abs(self.oldVar - value) > self.__record_interval
         ):
             self.main_canvas.record_path()
             self.oldVar = value
@@ -353,12 +452,23 @@ class InputsWidget(QWidget, Ui_Form):
             self.variable_play.setChecked(False)
             self.inputs_play_shaft.stop()
         self.get_back_position()
-        for i, (p0, p1, a) in enumerate(self.input_pairs()):
-            self.variable_list.item(i).setText('->'.join([
-                f'Point{p0}',
-                f'Point{p1}',
-                f"{self.vpoints[p0].slope_angle(self.vpoints[p1]):.02f}",
-            ]))
+        vpoints = self.vpoints
+        pairs = list(self.input_pairs())
+        # One repaint for the whole batch instead of one per item
+        self.variable_list.setUpdatesEnabled(False)
+        self.variable_list.blockSignals(True)
+        try:
+            for i, (p0, p1, a) in enumerate(pairs):
+                angle = float(f"{vpoints[p0].slope_angle(vpoints[p1]):.02f}")
+                if angle == a:
+                    # Already showing this value
+                    continue
+                item = self.variable_list.item(i)
+                item.setText(f"Point{p0}->Point{p1}->{angle:.02f}")
+                item.setData(Qt.UserRole, (p0, p1, angle))
+        finally:
+            self.variable_list.blockSignals(False)
+            self.variable_list.setUpdatesEnabled(True)
         self.__dial_ok()
         self.solve()
 
@@ -375,6 +485,10 @@ class InputsWidget(QWidget, Ui_Form):
     @Slot()
     def __change_index(self) -> None:
         """QTimer change index."""
+        if self.__resolve_pending or self.window().isMinimized():
+            # Do not pile ticks onto a solve that has not run yet,
+            # nor animate a minimized window
+            return
         index = self.dial.value()
         speed = self.variable_speed.value()
         extreme_rebound = (
@@ -401,32 +515,52 @@ class InputsWidget(QWidget, Ui_Form):
             "Recording completed!",
             "Please input name tag:"
         )
-        i = 0
-        name = name or f"Record_{i}"
-        while name in self.__paths:
-            name = f"Record_{i}"
-            i += 1
-        QMessageBox.information(self, "Record",
-                                "The name tag is being used or empty.")
+        base = name or "Record"
+        if not name:
+            name = f"{base}_0"
+        if name in self.__paths:
+            # Keep what the user typed and only add a serial suffix
+            i = 1
+            while f"{base}_{i}" in self.__paths:
+                i += 1
+            name = f"{base}_{i}"
+            QMessageBox.information(
+                self,
+                "Record",
+                f"The name tag is in use; saved as \"{name}\"."
+            )
         self.add_path(name, path, path_slider)
 
     def add_path(self, name: str, path: _Paths, slider: _SliderPaths) -> None:
         """Add path function."""
+        # Keep each joint path as an ndarray; the plot, export and
+        # animation consumers all want arrays anyway
         self.command_stack.push(AddPath(
             self.record_list,
             name,
             self.__paths,
             self.__slider_paths,
-            path,
-            slider
+            tuple(asarray(p, dtype=float) for p in path),
+            {i: asarray(p, dtype=float) for i, p in slider.items()}
         ))
         self.record_list.setCurrentRow(self.record_list.count() - 1)
 
     def load_paths(self, paths: Mapping[str, _Paths],
                    slider_paths: Mapping[str, _SliderPaths]) -> None:
         """Add multiple paths."""
-        for name, path in paths.items():
-            self.add_path(name, path, slider_paths.get(name, {}))
+        if not paths:
+            return
+        # Suppress the per-row canvas reload; redraw once at the end
+        self.record_list.blockSignals(True)
+        try:
+            for name, path in paths.items():
+                self.add_path(name, path, slider_paths.get(name, {}))
+        finally:
+            self.record_list.blockSignals(False)
+        self.record_list.setCurrentRow(self.record_list.count() - 1)
+        if not self.record_show.isChecked():
+            self.record_show.setChecked(True)
+        self.reload_canvas()
 
     @Slot(name='on_record_remove_clicked')
     def __remove_path(self) -> None:
@@ -467,11 +601,11 @@ class InputsWidget(QWidget, Ui_Form):
         if not file_name:
             return
         with open(file_name, 'w+', encoding='utf-8', newline='') as stream:
-            w = writer(stream)
             for path in paths:
-                for point in path:
-                    w.writerow(point)
-                w.writerow(())
+                # One C-level formatting pass instead of a writerow
+                # call per coordinate; %.17g keeps round-trip precision
+                savetxt(stream, asarray(path), delimiter=',', fmt='%.17g')
+                stream.write('\n')
         logger.info(f"Output path data: {file_name}")
 
     def __current_path_name(self) -> str:
@@ -485,9 +619,11 @@ class InputsWidget(QWidget, Ui_Form):
         num = 0
         name_copy = f"{name}_{num}"
         while name_copy in self.__paths:
-            name_copy = f"{name}_{num}"
             num += 1
-        self.add_path(name_copy, copy(self.__paths[name]), {})
+            name_copy = f"{name}_{num}"
+        # Recorded paths are never edited in place, so the copy can
+        # share the same arrays
+        self.add_path(name_copy, self.__paths[name], {})
 
     @Slot(name='on_cp_data_button_clicked')
     def __copy_path_data(self) -> None:
@@ -495,9 +631,11 @@ class InputsWidget(QWidget, Ui_Form):
         data = self.__paths[self.__current_path_name()]
         if not data:
             return
-        QApplication.clipboard().setText('\n'.join(
-            f"[{x}, {y}]," for x, y in data[self.plot_joint.currentIndex()]
-        ))
+        # Bound format method; skips unpacking every pair in Python
+        QApplication.clipboard().setText('\n'.join(map(
+            "[{0[0]}, {0[1]}],".format,
+            data[self.plot_joint.currentIndex()]
+        )))
 
     @Slot(name='on_show_button_clicked')
     def __show_path(self) -> None:
@@ -581,34 +719,37 @@ class InputsWidget(QWidget, Ui_Form):
                 pos[:] -= array(slider_data.get(joint_wrt, []))
             else:
                 pos[:] -= array(data[joint_wrt])
-        vel = derivative(pos)
-        acc = derivative(vel)
-        cur = curvature(data[joint])
-        plot = {}
-        plot_count = 0
+        # Each quantity is a full pass over the path; only derive the
+        # ones the checked plots actually need
+        need_jerk = self.plot_jerk.isChecked()
+        need_acc = self.plot_acc.isChecked() or need_jerk
+        need_vel = self.plot_vel.isChecked() or need_acc
+        need_signature = self.plot_signature.isChecked()
+        need_cur = self.plot_curvature.isChecked() or need_signature
+        plot: Dict[str, ndarray] = {}
         if self.plot_pos.isChecked():
-            plot_count += 1
             plot["Position"] = pos
-        if self.plot_vel.isChecked():
-            plot_count += 1
-            plot["Velocity"] = vel
-        if self.plot_acc.isChecked():
-            plot_count += 1
-            plot["Acceleration"] = acc
-        if self.plot_jerk.isChecked():
-            plot_count += 1
-            plot["Jerk"] = derivative(acc)
-        if self.plot_curvature.isChecked():
-            plot_count += 1
-            plot["Curvature"] = cur
-        if self.plot_signature.isChecked():
-            plot_count += 1
-            plot["Path Signature"] = path_signature(cur)
-        if plot_count < 1:
+        if need_vel:
+            vel = derivative(pos)
+            if self.plot_vel.isChecked():
+                plot["Velocity"] = vel
+            if need_acc:
+                acc = derivative(vel)
+                if self.plot_acc.isChecked():
+                    plot["Acceleration"] = acc
+                if need_jerk:
+                    plot["Jerk"] = derivative(acc)
+        if need_cur:
+            cur = curvature(data[joint])
+            if self.plot_curvature.isChecked():
+                plot["Curvature"] = cur
+            if need_signature:
+                plot["Path Signature"] = path_signature(cur)
+        if not plot:
             QMessageBox.warning(self, "No target", "No any plotting target.")
             return
         polar = self.p_coord_sys.isChecked()
-        row = plot_count
+        row = len(plot)
         col = 1
         if polar:
             row, col = col, row
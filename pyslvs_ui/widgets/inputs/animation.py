@@ -2,7 +2,7 @@
 
 """The vector animation dialog."""
 
-from typing import Sequence, Tuple, Mapping
+from typing import Sequence, Tuple, Mapping, Union
 from math import cos, sin, atan2, hypot, degrees
 from qtpy.QtCore import Qt, Slot, QTimer
 from qtpy.QtWidgets import (
@@ -17,8 +17,10 @@ from pyslvs_ui.graphics import (
 )
 
 _Coord = Tuple[float, float]
-_Paths = Sequence[Sequence[_Coord]]
-_SliderPaths = Mapping[int, Sequence[_Coord]]
+# Recorded paths come in as 2D float arrays
+_Path = Union[Sequence[_Coord], ndarray]
+_Paths = Sequence[_Path]
+_SliderPaths = Mapping[int, _Path]
 _Vecs = Mapping[int, ndarray]
 
 
@@ -13,12 +13,12 @@ __email__ = "pyslvs@gmail.com"
 
 from abc import abstractmethod
 from dataclasses import astuple
-from time import process_time
+from time import perf_counter
 from typing import (
-    cast, TYPE_CHECKING, Tuple, List, Mapping, Iterator, Sequence, Union,
+    cast, TYPE_CHECKING, Tuple, List, Dict, Mapping, Iterator, Sequence, Union,
     Optional, TypeVar, Generic,
 )
-from qtpy.QtCore import Signal, Qt, QTimer, Slot
+from qtpy.QtCore import Signal, Qt, QTimer, Slot, QModelIndex, QPointF
 from qtpy.QtWidgets import (
     QTableWidget,
     QSizePolicy,
@@ -29,8 +29,11 @@ from qtpy.QtWidgets import (
     QHeaderView,
     QLabel,
     QWidget,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
 )
-from qtpy.QtGui import QKeyEvent
+from qtpy.QtGui import QKeyEvent, QPainter, QStaticText
 from pyslvs import EStack, Coord, VPoint, VLink, PointArgs, LinkArgs
 from pyslvs_ui.qt_patch import QABCMeta
 from pyslvs_ui.graphics import color_icon
@@ -42,6 +45,46 @@ _Data = TypeVar('_Data', VPoint, VLink)
 _Coord = Tuple[float, float]
 
 
+class CoordDelegate(QStyledItemDelegate):
+    """Paint formatted coordinate cells from cached layouts.
+
+    QStaticText keeps the laid-out glyphs of a cell, so the repaints
+    triggered by selection and scrolling skip text shaping entirely.
+    An entry is rebuilt when the cell text changes.
+    """
+
+    def __init__(self, parent: QWidget):
+        super(CoordDelegate, self).__init__(parent)
+        self.__cache: Dict[Tuple[int, int], QStaticText] = {}
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex
+    ) -> None:
+        """Draw the cached static text over the themed background."""
+        text = index.data()
+        if not text:
+            super(CoordDelegate, self).paint(painter, option, index)
+            return
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+            painter.setPen(option.palette.highlightedText().color())
+        else:
+            painter.setPen(option.palette.text().color())
+        key = (index.row(), index.column())
+        st = self.__cache.get(key)
+        if st is None or st.text() != text:
+            st = QStaticText(text)
+            self.__cache[key] = st
+        rect = option.rect
+        painter.drawStaticText(QPointF(
+            rect.x() + 2,
+            rect.y() + (rect.height() - st.size().height()) / 2
+        ), st)
+
+
 class BaseTableWidget(QTableWidget, Generic[_Data], metaclass=QABCMeta):
     """Two tables has some shared function."""
     headers: Sequence[str] = ()
@@ -51,6 +94,7 @@ class BaseTableWidget(QTableWidget, Generic[_Data], metaclass=QABCMeta):
 
     def __init__(self, row: int, parent: QWidget):
         super(BaseTableWidget, self).__init__(parent)
+        self.__row_cache: Dict[Tuple[int, bool], Tuple[str, ...]] = {}
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setStatusTip("This table will show about the entities items in "
                           "current view mode.")
@@ -61,12 +105,15 @@ class BaseTableWidget(QTableWidget, Generic[_Data], metaclass=QABCMeta):
 
         self.setRowCount(row)
         self.setColumnCount(len(self.headers))
-        for i, e in enumerate(self.headers):
-            self.setHorizontalHeaderItem(i, QTableWidgetItem(e))
+        self.setHorizontalHeaderLabels(list(self.headers))
 
-        # Table widget column width.
+        # Table widget column width
+        # Content-sized widths are recomputed on demand instead of on
+        # every model change
         header = self.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        self.resizeColumnsToContents()
+        self.__resize_pending = False
 
         @Slot()
         def emit_selection_changed() -> None:
@@ -74,12 +121,28 @@ class BaseTableWidget(QTableWidget, Generic[_Data], metaclass=QABCMeta):
 
         self.itemSelectionChanged.connect(emit_selection_changed)
 
+    def schedule_column_resize(self) -> None:
+        """Fit columns to contents once the pending edits are done."""
+        if self.__resize_pending:
+            return
+        self.__resize_pending = True
+        QTimer.singleShot(0, self.__resize_columns)
+
+    @Slot()
+    def __resize_columns(self) -> None:
+        self.__resize_pending = False
+        self.resizeColumnsToContents()
+
     def row_text(self, row: int, *, has_name: bool) -> List[str]:
         """Get the whole row of texts.
 
         + Edit point: has_name = False
         + Edit link: has_name = True
         """
+        key = (row, has_name)
+        cached = self.__row_cache.get(key)
+        if cached is not None:
+            return list(cached)
         texts = []
         for column in self.effective_range(has_name):
             item = self.item(row, column)
@@ -87,8 +150,34 @@ class BaseTableWidget(QTableWidget, Generic[_Data], metaclass=QABCMeta):
                 texts.append('')
             else:
                 texts.append(item.text())
+        self.__row_cache[key] = tuple(texts)
         return texts
 
+    def invalidate_row_text(self, row: Optional[int] = None) -> None:
+        """Drop cached row texts; all of them if the row is unspecified.
+
+        Must be called by writers that bypass setItem (item.setText).
+        """
+        if row is None:
+            self.__row_cache.clear()
+        else:
+            self.__row_cache.pop((row, True), None)
+            self.__row_cache.pop((row, False), None)
+
+    def setItem(self, row: int, column: int,
+                item: QTableWidgetItem) -> None:
+        self.invalidate_row_text(row)
+        super(BaseTableWidget, self).setItem(row, column, item)
+
+    def insertRow(self, row: int) -> None:
+        # Rows below shift; the keys no longer match
+        self.invalidate_row_text()
+        super(BaseTableWidget, self).insertRow(row)
+
+    def removeRow(self, row: int) -> None:
+        self.invalidate_row_text()
+        super(BaseTableWidget, self).removeRow(row)
+
     @abstractmethod
     def effective_range(self, has_name: bool) -> Iterator[int]:
         """Return valid column range for row text."""
@@ -96,8 +185,9 @@ class BaseTableWidget(QTableWidget, Generic[_Data], metaclass=QABCMeta):
 
     def selected_rows(self) -> List[int]:
         """Get what row is been selected."""
-        return [row for row in range(self.rowCount())
-                if self.item(row, 0).isSelected()]
+        # Ask the selection model instead of probing every row
+        return sorted(index.row()
+                      for index in self.selectionModel().selectedRows())
 
     def selectAll(self) -> None:
         """Override method of select all function."""
@@ -160,8 +250,9 @@ class BaseTableWidget(QTableWidget, Generic[_Data], metaclass=QABCMeta):
 
     def clear(self) -> None:
         """Overridden the clear function, just removed all items."""
-        for row in range(self.rowCount()):
-            self.removeRow(0)
+        self.invalidate_row_text()
+        # One model update instead of removing row by row
+        self.setRowCount(0)
 
     @Slot()
     def clearSelection(self) -> None:
@@ -178,6 +269,9 @@ class PointTableWidget(BaseTableWidget[VPoint]):
 
     def __init__(self, parent: QWidget):
         super(PointTableWidget, self).__init__(0, parent)
+        delegate = CoordDelegate(self)
+        for column in (4, 5, 6):
+            self.setItemDelegateForColumn(column, delegate)
 
     def edit_point(self, row: int, arg: PointArgs) -> None:
         """Edit a point."""
@@ -189,6 +283,7 @@ class PointTableWidget(BaseTableWidget[VPoint]):
             if i == 3:
                 item.setIcon(color_icon(e))
             self.setItem(row, i, item)
+        self.schedule_column_resize()
 
     def row_data(self, row: int) -> PointArgs:
         """Return row data for 'edit_point' method."""
@@ -205,11 +300,17 @@ class PointTableWidget(BaseTableWidget[VPoint]):
     def current_position(self, row: int) -> List[_Coord]:
         """Get the current coordinate from a point."""
         type_str = self.item(row, 2).text().split(':')
-        coords_text = self.item(row, 6).text().replace(';', ',')
-        coords = eval(f"[{coords_text}]")
+        coords_text = self.item(row, 6).text()
+        # Parse "(x1, y1); (x2, y2)" text without compiling it as code
+        coords = []
+        if coords_text:
+            for coord_text in coords_text.split(';'):
+                x_text, y_text = coord_text.strip(' ()').split(',')
+                coords.append((float(x_text), float(y_text)))
         if (type_str[0] in {'P', 'RP'}) and len(coords) == 1:
             x, y = coords[0]
             self.item(row, 6).setText("; ".join([f"({x:.06f}, {y:.06f})"] * 2))
+            self.invalidate_row_text(row)
             coords.append(coords[0])
         return coords
 
@@ -218,16 +319,24 @@ class PointTableWidget(BaseTableWidget[VPoint]):
         coords: Sequence[Union[_Coord, Tuple[_Coord, _Coord]]]
     ) -> None:
         """Update the current coordinate for a point."""
+        self.invalidate_row_text()
+        # Bound format method shared by the whole pass; isinstance also
+        # accepts the NumPy scalars handed back by the solver
+        fmt = "({:.06f}, {:.06f})".format
         for i, c in enumerate(coords):
-            if type(c[0]) is float:
-                x, y = cast(_Coord, c)
-                text = f"({x:.06f}, {y:.06f})"
+            if isinstance(c[0], (int, float)):
+                text = fmt(c[0], c[1])
             else:
                 (x1, y1), (x2, y2) = cast(Tuple[_Coord, _Coord], c)
-                text = f"({x1:.06f}, {y1:.06f}); ({x2:.06f}, {y2:.06f})"
-            item = QTableWidgetItem(text)
+                text = f"{fmt(x1, y1)}; {fmt(x2, y2)}"
+            item = self.item(i, 6)
+            if item is None:
+                # First write of this row
+                item = QTableWidgetItem(text)
+                self.setItem(i, 6, item)
+            else:
+                item.setText(text)
             item.setToolTip(text)
-            self.setItem(i, 6, item)
 
     def get_back_position(self) -> None:
         """Let all the points go back to origin coordinate."""
@@ -240,6 +349,10 @@ class PointTableWidget(BaseTableWidget[VPoint]):
         item = self.item(row, 1)
         if not item:
             return []
+        # The undo commands attach the parsed names to the item
+        cached = item.data(Qt.UserRole)
+        if cached is not None:
+            return list(cached)
         return [s for s in item.text().split(',') if s]
 
     def set_selections(self, selections: Sequence[int],
@@ -282,6 +395,7 @@ class LinkTableWidget(BaseTableWidget[VLink]):
             if i == 1:
                 item.setIcon(color_icon(e))
             self.setItem(row, i, item)
+        self.schedule_column_resize()
 
     def row_data(self, row: int) -> LinkArgs:
         """Return row data for 'edit_link' method."""
@@ -302,6 +416,10 @@ class LinkTableWidget(BaseTableWidget[VLink]):
         item = self.item(row, 2)
         if not item:
             return []
+        # The undo commands attach the parsed indices to the item
+        cached = item.data(Qt.UserRole)
+        if cached is not None:
+            return list(cached)
         link_str = item.text()
         return [int(s.replace('Point', '')) for s in link_str.split(',') if s]
 
@@ -369,6 +487,7 @@ class ExprTableWidget(BaseTableWidget):
             self.setItem(row, self.columnCount() - 1, QTableWidgetItem(f"P{p}"))
             row += 1
         self.exprs = exprs
+        self.schedule_column_resize()
 
     def effective_range(self, has_name: bool) -> Iterator[int]:
         """Return column count."""
@@ -425,7 +544,8 @@ class FPSLabel(QLabel):
 
     def __init__(self, parent: QWidget):
         super(FPSLabel, self).__init__(parent)
-        self.__t0 = process_time()
+        self.__t0 = perf_counter()
+        self.__frames = 0
         self.__frame_timer = QTimer()
         self.__frame_timer.timeout.connect(self.__update_text)
         self.__frame_timer.start(1000)
@@ -433,12 +553,14 @@ class FPSLabel(QLabel):
     @Slot()
     def __update_text(self) -> None:
         """Update FPS with timer."""
-        t1 = process_time() - self.__t0
-        fps = 1 / t1 if t1 else 1
+        t1 = perf_counter()
+        interval = t1 - self.__t0
+        fps = self.__frames / interval if interval else 0.
         self.setText(f"FPS: {fps:6.02f}")
+        self.__t0 = t1
+        self.__frames = 0
 
     @Slot()
     def update_text(self) -> None:
-        """Update FPS with timer."""
-        self.__update_text()
-        self.__t0 = process_time()
+        """Count a frame rendered by the canvas."""
+        self.__frames += 1
@@ -21,9 +21,12 @@ __email__ = "pyslvs@gmail.com"
 
 from typing import (
     cast, Type, Sequence, List, Dict, Mapping, Tuple, Iterator, Iterable,
-    Generic, Optional, TypeVar,
+    Generic, Optional, TypeVar, Union,
 )
 from abc import abstractmethod
+from array import array
+from contextlib import contextmanager
+from dataclasses import astuple
 from qtpy.QtCore import Qt
 from qtpy.QtWidgets import (
     QUndoCommand,
@@ -34,16 +37,44 @@ from qtpy.QtWidgets import (
     QWidget,
 )
 from qtpy.QtGui import QIcon, QPixmap
+from numpy import asarray, ndarray
 from pyslvs import VJoint, VPoint, VLink, color_rgb, PointArgs, LinkArgs
 from pyslvs_ui.qt_patch import QABCMeta
 from .tables import BaseTableWidget, PointTableWidget, LinkTableWidget
 
 _Coord = Tuple[float, float]
-_Paths = Sequence[Sequence[_Coord]]
-_SliderPaths = Mapping[int, Sequence[_Coord]]
+# Recorded paths are stored as 2D float arrays
+_Path = Union[Sequence[_Coord], ndarray]
+_Paths = Sequence[_Path]
+_SliderPaths = Mapping[int, _Path]
 _ITEM_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
 _Data = TypeVar('_Data', VPoint, VLink)
 _Args = TypeVar('_Args', PointArgs, LinkArgs)
+_V = TypeVar('_V', int, str)
+
+
+_POINT_NAMES: List[str] = []
+_mech_icon: Optional[QIcon] = None
+
+
+def _mechanism_icon() -> QIcon:
+    """Shared icon of storage items, decoded on first use."""
+    global _mech_icon
+    if _mech_icon is None:
+        _mech_icon = QIcon(QPixmap(":/icons/mechanism.png"))
+    return _mech_icon
+
+
+def _point_name(i: int) -> str:
+    """Shared 'Point{i}' strings for the hot redo/undo joins.
+
+    The names repeat on every command execution; formatting them once
+    and reusing the objects keeps the joins allocation-free.
+    """
+    if i >= len(_POINT_NAMES):
+        _POINT_NAMES.extend(
+            f'Point{k}' for k in range(len(_POINT_NAMES), i + 1))
+    return _POINT_NAMES[i]
 
 
 def _no_empty(str_list: Iterable[str]) -> Iterator[str]:
@@ -51,6 +82,35 @@ def _no_empty(str_list: Iterable[str]) -> Iterator[str]:
     yield from (s for s in str_list if s)
 
 
+def _diff_sorted(
+    new: Sequence[_V],
+    old: Sequence[_V]
+) -> Tuple[List[_V], List[_V]]:
+    """Diff two sorted sequences into (added, removed) lists.
+
+    An edit typically changes a handful of entries; the linear merge
+    avoids building two hash sets just to subtract them twice.
+    """
+    added = []
+    removed = []
+    i = j = 0
+    while i < len(new) and j < len(old):
+        a = new[i]
+        b = old[j]
+        if a == b:
+            i += 1
+            j += 1
+        elif a < b:
+            added.append(a)
+            i += 1
+        else:
+            removed.append(b)
+            j += 1
+    added.extend(new[i:])
+    removed.extend(old[j:])
+    return added, removed
+
+
 def _args2vpoint(args: PointArgs) -> VPoint:
     """Make arguments as a VPoint object."""
     link = _no_empty(args.links.split(','))
@@ -66,12 +126,37 @@ def _args2vpoint(args: PointArgs) -> VPoint:
     return VPoint(link, type_int, angle, args.color, args.x, args.y, color_rgb)
 
 
+@contextmanager
+def _batched(table: BaseTableWidget) -> Iterator[None]:
+    """Hold back repaints and change signals during a multi-row write.
+
+    The view repaints once when updates are re-enabled instead of once
+    per touched cell.
+    """
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    try:
+        yield
+    finally:
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+
+
+def _args_delta(new: _Args, old: _Args) -> Dict[int, object]:
+    """Keep only the fields that differ between two argument tuples."""
+    return {
+        i: o for i, (n, o) in enumerate(zip(astuple(new), astuple(old)))
+        if n != o
+    }
+
+
 def _args2vlink(args: LinkArgs) -> VLink:
     """Make arguments as a VLink object."""
     if args.name == '':
         return VLink.HOLDER
     return VLink(args.name, args.color, [
-        int(p.replace('Point', ''))
+        # The tokens are always 'Point{i}'; skip the prefix directly
+        int(p[5:])
         for p in _no_empty(args.points.split(','))
     ], color_rgb)
 
@@ -115,9 +200,11 @@ class AddTable(_FusedTable[_Data]):
             VLink.HOLDER
         ))
         row = self.table.rowCount()
-        self.table.insertRow(row)
-        for column in range(row):
-            self.table.setItem(row, column, QTableWidgetItem(''))
+        with _batched(self.table):
+            self.table.insertRow(row)
+            # Was range(row): the tail columns stayed without items
+            for column in range(self.table.columnCount()):
+                self.table.setItem(row, column, QTableWidgetItem(''))
 
     def undo(self) -> None:
         """Remove the last row directly."""
@@ -160,9 +247,10 @@ class DeleteTable(_FusedTable[_Data]):
             if self.table_type is PointTableWidget else
             VLink.HOLDER
         ))
-        self.table.insertRow(self.row)
-        for column in range(self.table.columnCount()):
-            self.table.setItem(self.row, column, QTableWidgetItem(''))
+        with _batched(self.table):
+            self.table.insertRow(self.row)
+            for column in range(self.table.columnCount()):
+                self.table.setItem(self.row, column, QTableWidgetItem(''))
 
 
 class FixSequenceNumber(QUndoCommand):
@@ -194,18 +282,45 @@ class FixSequenceNumber(QUndoCommand):
         if not vlink.points:
             return
         points = list(vlink.points)
-        if benchmark:
+        if len(points) > 16:
+            # Compare-to-mask shift; pays off once the link has enough
+            # joints to amortize the array round trip
+            a = asarray(points)
+            if benchmark:
+                a -= a > self.benchmark
+            else:
+                a += a >= self.benchmark
+            points = a.tolist()
+        elif benchmark:
             points = [p - 1 if p > self.benchmark else p for p in points]
         else:
             points = [p + 1 if p >= self.benchmark else p for p in points]
         vlink.set_points(points)
         item = self.link_table.item(self.row, 2)
-        item.setText(','.join([f'Point{p}' for p in points]))
+        item.setText(','.join([_point_name(p) for p in points]))
+        # Renumbering must also refresh the parsed-points cache,
+        # get_points prefers it over the text
+        item.setData(Qt.UserRole, tuple(points))
+        self.link_table.invalidate_row_text(self.row)
 
 
 class _EditFusedTable(QUndoCommand, Generic[_Args], metaclass=QABCMeta):
     """Edit table command of fused type."""
     args: _Args
+    old_delta: Dict[int, object]
+
+    @property
+    def old_args(self) -> _Args:
+        """Arguments before the edit, rebuilt from the stored delta.
+
+        Long histories hold thousands of edit commands; keeping only
+        the changed fields instead of the whole tuple bounds their
+        memory to the size of the actual change.
+        """
+        fields = list(astuple(self.args))
+        for i, value in self.old_delta.items():
+            fields[i] = value
+        return type(self.args)(*fields)
 
     @abstractmethod
     def __init__(
@@ -252,20 +367,29 @@ class EditPointTable(_EditFusedTable[PointArgs]):
             args_list,
             parent
         )
-        self.old_args = self.point_table.row_data(row)
-        # Links: Set[str]
-        new_links = set(self.args.links.split(','))
-        old_links = set(self.old_args.links.split(','))
+        old_args = self.point_table.row_data(row)
+        self.old_delta = _args_delta(self.args, old_args)
+        self.__find_link_items(old_args)
+
+    def __find_link_items(self, old_args: PointArgs) -> None:
+        """Find the rows of the links this edit adds to or removes from."""
+        added, removed = _diff_sorted(
+            sorted(_no_empty(self.args.links.split(','))),
+            sorted(_no_empty(old_args.links.split(',')))
+        )
         new_link_items = []
         old_link_items = []
-        for row, vlink in enumerate(self.vlink_list):
-            name = vlink.name
-            if name in (new_links - old_links):
-                new_link_items.append(row)
-            if name in (old_links - new_links):
-                old_link_items.append(row)
-        self.new_link_items = tuple(new_link_items)
-        self.old_link_items = tuple(old_link_items)
+        # Most edits never touch the links; skip the scan entirely then
+        if added or removed:
+            for i, vlink in enumerate(self.vlink_list):
+                name = vlink.name
+                if name in added:
+                    new_link_items.append(i)
+                elif name in removed:
+                    old_link_items.append(i)
+        # Machine-sized ints; the stack may hold thousands of these
+        self.new_link_items = array('i', new_link_items)
+        self.old_link_items = array('i', old_link_items)
 
     def redo(self) -> None:
         """Write arguments then rewrite the dependents."""
@@ -275,9 +399,10 @@ class EditPointTable(_EditFusedTable[PointArgs]):
 
     def undo(self) -> None:
         """Rewrite the dependents then write arguments."""
+        old_args = self.old_args
         self.__write_links(self.old_link_items, self.new_link_items)
-        self.point_table.edit_point(self.row, self.old_args)
-        self.vpoint_list[self.row] = _args2vpoint(self.old_args)
+        self.point_table.edit_point(self.row, old_args)
+        self.vpoint_list[self.row] = _args2vpoint(old_args)
 
     def __write_links(self, add: Sequence[int], sub: Sequence[int]) -> None:
         """Write table function.
@@ -285,19 +410,31 @@ class EditPointTable(_EditFusedTable[PointArgs]):
         + Append the point that relate with these links.
         + Remove the point that irrelevant with these links.
         """
-        for row in add:
-            new_points = list(self.vlink_list[row].points)
-            new_points.append(self.row)
-            self.__set_cell(row, new_points)
-        for row in sub:
-            new_points = list(self.vlink_list[row].points)
-            new_points.remove(self.row)
-            self.__set_cell(row, new_points)
-
-    def __set_cell(self, row: int, points: Iterable[int]) -> None:
-        item = QTableWidgetItem(','.join(f'Point{p}' for p in points))
-        item.setFlags(_ITEM_FLAGS)
-        self.link_table.setItem(row, 2, item)
+        if not (add or sub):
+            return
+        with _batched(self.link_table):
+            for row in add:
+                new_points = list(self.vlink_list[row].points)
+                new_points.append(self.row)
+                self.__set_cell(row, new_points)
+            for row in sub:
+                new_points = list(self.vlink_list[row].points)
+                new_points.remove(self.row)
+                self.__set_cell(row, new_points)
+
+    def __set_cell(self, row: int, points: Sequence[int]) -> None:
+        text = ','.join(_point_name(p) for p in points)
+        item = self.link_table.item(row, 2)
+        if item is None:
+            item = QTableWidgetItem(text)
+            item.setFlags(_ITEM_FLAGS)
+            self.link_table.setItem(row, 2, item)
+        else:
+            # Rewrite in place; setItem would free and reallocate
+            item.setText(text)
+            self.link_table.invalidate_row_text(row)
+        # Keep the parsed indices so readers can skip the string split
+        item.setData(Qt.UserRole, tuple(points))
         self.vlink_list[row].set_points(points)
 
 
@@ -326,18 +463,21 @@ class EditLinkTable(_EditFusedTable[LinkArgs]):
             args_list,
             parent
         )
-        self.old_args = self.link_table.row_data(row)
-        # Points: Set[int]
-        new_points = {
-            int(index.replace('Point', ''))
-            for index in _no_empty(self.args.points.split(','))
-        }
-        old_points = {
-            int(index.replace('Point', ''))
-            for index in _no_empty(self.old_args.points.split(','))
-        }
-        self.new_point_items = tuple(new_points - old_points)
-        self.old_point_items = tuple(old_points - new_points)
+        old_args = self.link_table.row_data(row)
+        self.old_delta = _args_delta(self.args, old_args)
+        self.__find_point_items(old_args)
+
+    def __find_point_items(self, old_args: LinkArgs) -> None:
+        """Find the points this edit adds to or removes from the link."""
+        added, removed = _diff_sorted(
+            sorted(int(index[5:])
+                   for index in _no_empty(self.args.points.split(','))),
+            sorted(int(index[5:])
+                   for index in _no_empty(old_args.points.split(',')))
+        )
+        # Machine-sized ints; the stack may hold thousands of these
+        self.new_point_items = array('i', added)
+        self.old_point_items = array('i', removed)
 
     def redo(self) -> None:
         """Write arguments then rewrite the dependents."""
@@ -349,25 +489,35 @@ class EditLinkTable(_EditFusedTable[LinkArgs]):
 
     def undo(self) -> None:
         """Rewrite the dependents then write arguments."""
-        self.__write_points(self.old_args.name, self.old_point_items,
+        old_args = self.old_args
+        self.__write_points(old_args.name, self.old_point_items,
                             self.new_point_items)
-        self.__rename(self.old_args.name, self.args)
-        self.link_table.edit_link(self.row, self.old_args)
-        self.vlink_list[self.row] = _args2vlink(self.old_args)
+        self.__rename(old_args.name, self.args)
+        self.link_table.edit_link(self.row, old_args)
+        self.vlink_list[self.row] = _args2vlink(old_args)
 
     def __rename(self, new_name: str, args: LinkArgs) -> None:
         """Adjust link name in all dependents, if link name are changed."""
         if args.name == new_name:
             return
+        old_name = args.name
         for index in _no_empty(args.points.split(',')):
-            row = int(index.replace('Point', ''))
-            item = QTableWidgetItem(','.join(_no_empty(
-                link.replace(args.name, new_name)
-                for link in self.vpoint_list[row].links
-            )))
-            item.setFlags(_ITEM_FLAGS)
-            self.point_table.setItem(row, 1, item)
-            self.vpoint_list[row].replace_link(args.name, new_name)
+            row = int(index[5:])
+            # Compare whole tokens; str.replace would also clobber
+            # names that merely contain the old name as a substring
+            links = [new_name if link == old_name else link
+                     for link in _no_empty(self.vpoint_list[row].links)]
+            text = ','.join(links)
+            item = self.point_table.item(row, 1)
+            if item is None:
+                item = QTableWidgetItem(text)
+                item.setFlags(_ITEM_FLAGS)
+                self.point_table.setItem(row, 1, item)
+            else:
+                item.setText(text)
+                self.point_table.invalidate_row_text(row)
+            item.setData(Qt.UserRole, tuple(links))
+            self.vpoint_list[row].replace_link(old_name, new_name)
 
     def __write_points(self, name: str, add: Sequence[int],
                        sub: Sequence[int]) -> None:
@@ -376,20 +526,32 @@ class EditLinkTable(_EditFusedTable[LinkArgs]):
         + Append the link that relate with these points.
         + Remove the link that irrelevant with these points.
         """
-        for row in add:
-            new_links = list(self.vpoint_list[row].links)
-            new_links.append(name)
-            self.__set_cell(row, new_links)
-        for row in sub:
-            new_links = list(self.vpoint_list[row].links)
-            if name:
-                new_links.remove(name)
-            self.__set_cell(row, new_links)
-
-    def __set_cell(self, row: int, links: Iterable[str]) -> None:
-        item = QTableWidgetItem(','.join(links))
-        item.setFlags(_ITEM_FLAGS)
-        self.point_table.setItem(row, 1, item)
+        if not (add or sub):
+            return
+        with _batched(self.point_table):
+            for row in add:
+                new_links = list(self.vpoint_list[row].links)
+                new_links.append(name)
+                self.__set_cell(row, new_links)
+            for row in sub:
+                new_links = list(self.vpoint_list[row].links)
+                if name:
+                    new_links.remove(name)
+                self.__set_cell(row, new_links)
+
+    def __set_cell(self, row: int, links: Sequence[str]) -> None:
+        text = ','.join(links)
+        item = self.point_table.item(row, 1)
+        if item is None:
+            item = QTableWidgetItem(text)
+            item.setFlags(_ITEM_FLAGS)
+            self.point_table.setItem(row, 1, item)
+        else:
+            # Rewrite in place; setItem would free and reallocate
+            item.setText(text)
+            self.point_table.invalidate_row_text(row)
+        # Keep the parsed names so readers can skip the string split
+        item.setData(Qt.UserRole, tuple(links))
         self.vpoint_list[row].set_links(links)
 
 
@@ -414,7 +576,12 @@ class AddPath(QUndoCommand):
         self.slider_paths = slider_paths
         self.path = path
         self.slider_path = slider_path
-        self.targets = [i for i, p in enumerate(self.path) if len(set(p)) > 1]
+        self.targets = []
+        for i, p in enumerate(self.path):
+            # Moving joints have more than one distinct sample
+            a = asarray(p)
+            if len(a) and (a != a[0]).any():
+                self.targets.append(i)
 
     def redo(self) -> None:
         """Add new path data."""
@@ -447,8 +614,10 @@ class DeletePath(QUndoCommand):
         self.widget = widget
         self.paths = paths
         self.slider_paths = slider_paths
-        self.old_item = self.widget.item(self.row)
-        self.name = self.old_item.text().split(':')[0]
+        # Keep primitives only; the item is owned by the view and its
+        # wrapper may be destroyed before undo is called
+        self.old_text = self.widget.item(self.row).text()
+        self.name = self.old_text.split(':')[0]
         self.old_path = self.paths[self.name]
         self.old_slider_path = self.slider_paths[self.name]
 
@@ -462,8 +631,8 @@ class DeletePath(QUndoCommand):
         """Append back the path."""
         self.paths[self.name] = self.old_path
         self.slider_paths[self.name] = self.old_slider_path
-        self.widget.addItem(self.old_item)
-        self.widget.setCurrentRow(self.widget.row(self.old_item))
+        self.widget.insertItem(self.row, QListWidgetItem(self.old_text))
+        self.widget.setCurrentRow(self.row)
 
 
 class AddStorage(QUndoCommand):
@@ -486,7 +655,7 @@ class AddStorage(QUndoCommand):
         """Add mechanism expression to 'expr' attribute."""
         item = QListWidgetItem(self.name)
         item.expr = self.mechanism
-        item.setIcon(QIcon(QPixmap(":/icons/mechanism.png")))
+        item.setIcon(_mechanism_icon())
         self.widget.addItem(item)
 
     def undo(self) -> None:
@@ -518,7 +687,7 @@ class DeleteStorage(QUndoCommand):
         """Create a new item and recover expression."""
         item = QListWidgetItem(self.name)
         item.expr = self.mechanism
-        item.setIcon(QIcon(QPixmap(":/icons/mechanism.png")))
+        item.setIcon(_mechanism_icon())
         self.widget.insertItem(self.row, item)
 
 
@@ -567,6 +736,7 @@ class AddInput(QUndoCommand):
     def __init__(
         self,
         name: str,
+        pair: Tuple[int, int, float],
         widget: QListWidget,
         parent: Optional[QWidget] = None
     ):
@@ -574,6 +744,8 @@ class AddInput(QUndoCommand):
         self.setText(f"Add variable of {name}")
         self.item = QListWidgetItem(name)
         self.item.setToolTip(name)
+        # Parsed form of the text; readers skip the string split
+        self.item.setData(Qt.UserRole, pair)
         self.widget = widget
 
     def redo(self) -> None: